@@ -1,7 +1,48 @@
 # The following is required to make it possible to use the generated code as a package:
 # https://github.com/protocolbuffers/protobuf/issues/881#issuecomment-1615919615
 
+import importlib
 import os
 import sys
+import warnings
+
+# Prefer the native upb runtime so messages are decoded in C rather than by the
+# pure Python implementation. This only takes effect if google.protobuf has not
+# been imported yet, and an explicit choice in the environment always wins.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from google.protobuf.internal import api_implementation  # noqa: E402
+
+if api_implementation.Type() not in ("upb", "cpp"):
+    warnings.warn(
+        f"aptos_protos is using the {api_implementation.Type()!r} protobuf backend, "
+        "decoding will be an order of magnitude slower than with the upb backend. "
+        "Install protobuf>=4.21 and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION, "
+        "or import aptos_protos before google.protobuf.",
+        RuntimeWarning,
+    )
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+
+def preload() -> None:
+    """Imports every generated module, registering all descriptors in the default pool.
+
+    Pre-fork servers (Gunicorn, multiprocessing, Ray, ...) should call this in the
+    parent process before forking. Workers then inherit the already built descriptor
+    pool and message classes copy-on-write instead of each re-parsing the serialized
+    descriptors when they first import a generated module.
+
+    The generated modules import each other as `aptos.*` through the path set up
+    above, while applications import them as `aptos_protos.aptos.*`. Python treats
+    these as distinct modules, so both names are imported, including the `*_pb2_grpc`
+    service stubs.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    for directory, _, files in os.walk(os.path.join(root, "aptos")):
+        package = os.path.relpath(directory, root).replace(os.sep, ".")
+        for file in sorted(files):
+            if file.endswith(("_pb2.py", "_pb2_grpc.py")):
+                module = f"{package}.{file[:-3]}"
+                importlib.import_module(module)
+                importlib.import_module(f"{__name__}.{module}")
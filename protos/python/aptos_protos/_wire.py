@@ -0,0 +1,41 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Minimal protobuf wire format helpers used by the hand-written decoding utilities.
+
+Parsing messages is left to the protobuf backend, these only deal with the framing
+around serialized messages.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def decode_varint(buf: Buffer, pos: int) -> Tuple[int, int]:
+    """Decodes the varint at `pos`, returns the value and the position after it."""
+    try:
+        b = buf[pos]
+        # Values below 128 are a single byte.
+        if b < 0x80:
+            return b, pos + 1
+        result = b & 0x7F
+        shift = 7
+        pos += 1
+        while True:
+            b = buf[pos]
+            pos += 1
+            if b < 0x80:
+                return result | (b << shift), pos
+            result |= (b & 0x7F) << shift
+            shift += 7
+            if shift >= 70:
+                raise DecodeError("Varint is too long")
+    except IndexError:
+        raise DecodeError("Truncated varint") from None
@@ -0,0 +1,40 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from aptos_protos._wire import DecodeError, decode_varint
+from aptos_protos.aptos.transaction.v1.transaction_pb2 import Transaction
+
+
+def encode(value: int) -> bytes:
+    # The version field (1) is a uint64, so the payload after its tag byte is exactly
+    # the varint encoding of the value as produced by protobuf itself.
+    return Transaction(version=value).SerializeToString()[1:]
+
+
+class DecodeVarintTestCase(unittest.TestCase):
+    def testRoundTrip(self) -> None:
+        for value in [1, 127, 128, 300, 2**14, 2**32 - 1, 2**56, 2**64 - 1]:
+            data = encode(value)
+            self.assertEqual(decode_varint(data, 0), (value, len(data)))
+            self.assertEqual(decode_varint(memoryview(data), 0), (value, len(data)))
+
+    def testOffset(self) -> None:
+        data = b"\xff" + encode(300) + b"\x01"
+        self.assertEqual(decode_varint(data, 1), (300, 3))
+        self.assertEqual(decode_varint(data, 3), (1, 4))
+
+    def testTruncated(self) -> None:
+        with self.assertRaises(DecodeError):
+            decode_varint(b"", 0)
+        with self.assertRaises(DecodeError):
+            decode_varint(encode(2**32)[:-1], 0)
+
+    def testTooLong(self) -> None:
+        with self.assertRaises(DecodeError):
+            decode_varint(b"\xff" * 10 + b"\x01", 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
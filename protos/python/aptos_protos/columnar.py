@@ -0,0 +1,181 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Columnar decoding of scalar fields across a batch of serialized messages.
+
+Analytics over many transactions usually only need a handful of numeric fields.
+`decode_columns` parses the messages with the native protobuf backend and collects
+each of those fields into its own `array.array`, so the result holds one contiguous
+buffer per field instead of one Python int per value:
+
+```python
+from aptos_protos.aptos.transaction.v1.transaction_pb2 import Transaction
+from aptos_protos.columnar import decode_columns
+
+paths = ["version", "info.gas_used", "info.success"]
+columns = decode_columns(raws, Transaction, paths)
+gas_used = numpy.frombuffer(columns["info.gas_used"], dtype=numpy.uint64)
+```
+
+Fixed width `bytes` fields such as hashes are packed side by side into a single
+buffer with `decode_fixed_width` instead of being kept as one `bytes` object per hash.
+"""
+
+from __future__ import annotations
+
+import array
+import itertools
+import operator
+from dataclasses import dataclass
+from typing import Container, Dict, Iterable, Sequence, Tuple, Type
+
+from aptos_protos._wire import Buffer
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+
+_FieldDescriptor = _descriptor.FieldDescriptor
+
+_TYPECODES = {
+    _FieldDescriptor.TYPE_UINT64: "Q",
+    _FieldDescriptor.TYPE_FIXED64: "Q",
+    _FieldDescriptor.TYPE_INT64: "q",
+    _FieldDescriptor.TYPE_SINT64: "q",
+    _FieldDescriptor.TYPE_SFIXED64: "q",
+    _FieldDescriptor.TYPE_UINT32: "I",
+    _FieldDescriptor.TYPE_FIXED32: "I",
+    _FieldDescriptor.TYPE_INT32: "i",
+    _FieldDescriptor.TYPE_SINT32: "i",
+    _FieldDescriptor.TYPE_SFIXED32: "i",
+    _FieldDescriptor.TYPE_ENUM: "i",
+    _FieldDescriptor.TYPE_BOOL: "B",
+    _FieldDescriptor.TYPE_DOUBLE: "d",
+    _FieldDescriptor.TYPE_FLOAT: "f",
+}
+
+# Number of rows decode_columns transposes at once.
+_CHUNK_SIZE = 1024
+
+
+def _resolve(
+    message_cls: Type[_message.Message], path: str, leaf_types: Container[int]
+) -> _FieldDescriptor:
+    """Validates a dotted field path and returns the descriptor of its last field."""
+    descriptor = message_cls.DESCRIPTOR
+    names = path.split(".")
+    for i, name in enumerate(names):
+        try:
+            field = descriptor.fields_by_name[name]
+        except KeyError:
+            raise ValueError(f"{descriptor.full_name} has no field {name!r}") from None
+        if field.label == _FieldDescriptor.LABEL_REPEATED:
+            raise ValueError(f"Repeated field {name!r} cannot be used as a column")
+        if i < len(names) - 1:
+            if field.type != _FieldDescriptor.TYPE_MESSAGE:
+                raise ValueError(f"Field {name!r} of {path!r} is not a message")
+            descriptor = field.message_type
+        elif field.type not in leaf_types:
+            raise ValueError(f"Field {path!r} cannot be decoded into this column type")
+    return field
+
+
+def decode_columns(
+    raws: Iterable[Buffer],
+    message_cls: Type[_message.Message],
+    paths: Sequence[str],
+) -> Dict[str, array.array]:
+    """Decodes the scalar fields at `paths` of every message in `raws` into columns.
+
+    Paths are dotted field names relative to `message_cls`, e.g. `info.gas_used` or
+    `user.request.sequence_number`. Missing fields decode to their default value.
+    Each column is an `array.array` with a typecode matching the field type, and
+    supports the buffer protocol so it can be wrapped without copying.
+    """
+    typecodes = [
+        _TYPECODES[_resolve(message_cls, path, _TYPECODES).type] for path in paths
+    ]
+    if not paths:
+        return {}
+    columns = [array.array(typecode) for typecode in typecodes]
+    rows = map(operator.attrgetter(*paths), map(message_cls.FromString, raws))
+    if len(columns) == 1:
+        columns[0].extend(rows)
+    else:
+        # Transpose a bounded number of rows at a time, so that only the values of
+        # one chunk are ever held as Python objects.
+        while True:
+            chunk = list(itertools.islice(rows, _CHUNK_SIZE))
+            if not chunk:
+                break
+            for column, values in zip(columns, zip(*chunk)):
+                column.extend(values)
+    return dict(zip(paths, columns))
+
+
+# The 32 byte hashes of `TransactionInfo`, for use with `decode_fixed_width`.
+TRANSACTION_INFO_HASHES = (
+    "info.hash",
+    "info.state_change_hash",
+    "info.event_root_hash",
+    "info.state_checkpoint_hash",
+    "info.accumulator_root_hash",
+)
+
+
+@dataclass
+class FixedWidthColumns:
+    """Fixed width `bytes` fields of a batch of messages, packed into one buffer.
+
+    Values are stored row by row, each row holding one value per path in order. Wrap
+    `data` with `numpy.frombuffer(data, numpy.uint8).reshape(-1, len(paths), width)`
+    to compare them in bulk.
+    """
+
+    paths: Tuple[str, ...]
+    width: int
+    data: bytearray
+
+    def __post_init__(self) -> None:
+        if not self.paths:
+            raise ValueError("At least one path is required")
+        if self.width <= 0:
+            raise ValueError(f"Width must be positive, got {self.width}")
+
+    def __len__(self) -> int:
+        return len(self.data) // (len(self.paths) * self.width)
+
+    def get(self, row: int, path: str) -> memoryview:
+        """Returns the value of `path` in `row`, as a view into `data`."""
+        if not 0 <= row < len(self):
+            raise IndexError(f"Row {row} out of range")
+        start = (row * len(self.paths) + self.paths.index(path)) * self.width
+        return memoryview(self.data)[start : start + self.width]
+
+
+def decode_fixed_width(
+    raws: Iterable[Buffer],
+    message_cls: Type[_message.Message],
+    paths: Sequence[str],
+    width: int,
+) -> FixedWidthColumns:
+    """Decodes the `bytes` fields at `paths` of every message in `raws` side by side.
+
+    Every value must be exactly `width` bytes long, except for empty or missing
+    fields, which are stored as `width` zero bytes.
+    """
+    columns = FixedWidthColumns(tuple(paths), width, bytearray())
+    for path in paths:
+        _resolve(message_cls, path, (_FieldDescriptor.TYPE_BYTES,))
+    getter = operator.attrgetter(*paths)
+    single = len(paths) == 1
+    empty = bytes(width)
+    data = columns.data
+    for message in map(message_cls.FromString, raws):
+        values = getter(message)
+        for path, value in zip(paths, (values,) if single else values):
+            if len(value) == width:
+                data += value
+            elif not value:
+                data += empty
+            else:
+                raise ValueError(f"{path} is {len(value)} bytes long, not {width}")
+    return columns
@@ -0,0 +1,137 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from typing import List
+
+from aptos_protos.aptos.transaction.v1.transaction_pb2 import Transaction
+from aptos_protos.columnar import (
+    TRANSACTION_INFO_HASHES,
+    FixedWidthColumns,
+    decode_columns,
+    decode_fixed_width,
+)
+
+
+def make_transactions(count: int) -> List[Transaction]:
+    transactions = []
+    for i in range(count):
+        transaction = Transaction(
+            version=2**40 + i,
+            epoch=i % 3,
+            type=Transaction.TRANSACTION_TYPE_USER,
+        )
+        transaction.info.hash = bytes([i]) * 32
+        transaction.info.state_change_hash = bytes([i + 1]) * 32
+        transaction.info.event_root_hash = bytes([i + 2]) * 32
+        transaction.info.accumulator_root_hash = bytes([i + 3]) * 32
+        transaction.info.gas_used = 10 * i
+        transaction.info.success = i % 2 == 0
+        if i % 2:
+            # Only some transactions carry a state checkpoint hash or a user payload.
+            transaction.info.state_checkpoint_hash = bytes([i + 4]) * 32
+            transaction.user.request.sequence_number = i
+        transactions.append(transaction)
+    return transactions
+
+
+class DecodeColumnsTestCase(unittest.TestCase):
+    def testColumns(self) -> None:
+        transactions = make_transactions(6)
+        raws = [transaction.SerializeToString() for transaction in transactions]
+        paths = [
+            "version",
+            "epoch",
+            "type",
+            "info.gas_used",
+            "info.success",
+            "user.request.sequence_number",
+        ]
+        columns = decode_columns(raws, Transaction, paths)
+        self.assertEqual(list(columns), paths)
+        self.assertEqual(columns["version"].typecode, "Q")
+        self.assertEqual(columns["type"].typecode, "i")
+        self.assertEqual(columns["info.success"].typecode, "B")
+        for transaction, version, type_, gas_used, success, sequence_number in zip(
+            transactions,
+            columns["version"],
+            columns["type"],
+            columns["info.gas_used"],
+            columns["info.success"],
+            columns["user.request.sequence_number"],
+        ):
+            self.assertEqual(version, transaction.version)
+            self.assertEqual(type_, transaction.type)
+            self.assertEqual(gas_used, transaction.info.gas_used)
+            self.assertEqual(success, transaction.info.success)
+            self.assertEqual(sequence_number, transaction.user.request.sequence_number)
+
+    def testSinglePath(self) -> None:
+        raws = [t.SerializeToString() for t in make_transactions(3)]
+        columns = decode_columns(raws, Transaction, ["info.gas_used"])
+        self.assertEqual(list(columns["info.gas_used"]), [0, 10, 20])
+
+    def testManyRows(self) -> None:
+        # More rows than are transposed at once, ending in a partial chunk.
+        raws = [
+            Transaction(version=i, epoch=2 * i).SerializeToString() for i in range(2500)
+        ]
+        columns = decode_columns(raws, Transaction, ["version", "epoch"])
+        self.assertEqual(list(columns["version"]), list(range(2500)))
+        self.assertEqual(list(columns["epoch"]), list(range(0, 5000, 2)))
+
+    def testEmpty(self) -> None:
+        self.assertEqual(decode_columns([b""], Transaction, []), {})
+        columns = decode_columns([], Transaction, ["version", "epoch"])
+        self.assertEqual([len(column) for column in columns.values()], [0, 0])
+
+    def testInvalidPaths(self) -> None:
+        for path in [
+            "missing",
+            "info.missing",
+            "info.changes",
+            "version.value",
+            "info.hash",
+            "info",
+        ]:
+            with self.subTest(path=path), self.assertRaises(ValueError):
+                decode_columns([], Transaction, [path])
+
+
+class DecodeFixedWidthTestCase(unittest.TestCase):
+    def testHashes(self) -> None:
+        transactions = make_transactions(4)
+        raws = [transaction.SerializeToString() for transaction in transactions]
+        columns = decode_fixed_width(raws, Transaction, TRANSACTION_INFO_HASHES, 32)
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(len(columns.data), 4 * len(TRANSACTION_INFO_HASHES) * 32)
+        for row, transaction in enumerate(transactions):
+            for path in TRANSACTION_INFO_HASHES:
+                value = getattr(transaction.info, path.split(".")[1]) or bytes(32)
+                self.assertEqual(bytes(columns.get(row, path)), value)
+
+    def testWrongWidth(self) -> None:
+        raws = [t.SerializeToString() for t in make_transactions(2)]
+        with self.assertRaises(ValueError):
+            decode_fixed_width(raws, Transaction, ["info.hash"], 16)
+
+    def testInvalidPaths(self) -> None:
+        with self.assertRaises(ValueError):
+            decode_fixed_width([], Transaction, ["info.gas_used"], 8)
+        with self.assertRaises(ValueError):
+            decode_fixed_width([], Transaction, [], 32)
+        with self.assertRaises(ValueError):
+            decode_fixed_width([], Transaction, ["info.hash"], 0)
+
+    def testColumns(self) -> None:
+        columns = FixedWidthColumns(("a", "b"), 2, bytearray(b"abcdefgh"))
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(bytes(columns.get(1, "a")), b"ef")
+        self.assertEqual(bytes(columns.get(1, "b")), b"gh")
+        with self.assertRaises(IndexError):
+            columns.get(2, "a")
+        self.assertEqual(len(FixedWidthColumns(("a",), 32, bytearray())), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
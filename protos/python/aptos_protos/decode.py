@@ -0,0 +1,113 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers for decoding many messages at once.
+
+Messages are framed the same way as protobuf's own delimited streams
+(`writeDelimitedTo` / `parseDelimitedFrom` in other languages): every message is
+preceded by its length encoded as a varint. This lets a whole block of
+transactions travel or be stored as a single buffer that is decoded in one call.
+
+Spooled blocks can be read with `map_file`, which returns a read-only view of the
+page cache instead of reading the file into a `bytes` object:
+
+```python
+transactions = decode_length_prefixed(map_file("block.bin"), Transaction)
+```
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from typing import Iterable, Iterator, List, Type, TypeVar
+
+from aptos_protos._wire import Buffer, DecodeError, decode_varint
+from google.protobuf import message as _message
+
+M = TypeVar("M", bound=_message.Message)
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def encode_length_prefixed(messages: Iterable[_message.Message]) -> bytes:
+    """Serializes `messages` into a single buffer, each prefixed by its length."""
+    parts: List[bytes] = []
+    for message in messages:
+        data = message.SerializeToString()
+        parts.append(_encode_varint(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def iter_length_prefixed_frames(buf: Buffer) -> Iterator[memoryview]:
+    """Yields the payload of every length prefixed frame in `buf` without copying it."""
+    # Typed or multi-dimensional views count items rather than bytes.
+    view = memoryview(buf).cast("B")
+    pos = 0
+    end = len(view)
+    while pos < end:
+        length, pos = decode_varint(view, pos)
+        if pos + length > end:
+            raise DecodeError("Truncated length prefixed message")
+        yield view[pos : pos + length]
+        pos += length
+
+
+def map_file(path: str, offset: int = 0, length: int = 0) -> memoryview:
+    """Maps `length` bytes of the file at `path` from `offset` into memory, read-only.
+
+    A `length` of 0 maps everything up to the end of the file. The returned view keeps
+    the mapping alive, and it can be passed to any of the helpers in this module
+    without the contents ever being copied into a Python object.
+    """
+    if offset < 0 or length < 0:
+        raise ValueError(f"Invalid range {offset}+{length} of {path}")
+    # mmap offsets must be a multiple of the allocation granularity.
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if offset > size:
+            raise ValueError(f"Offset {offset} is past the end of {path}")
+        if length == 0:
+            length = size - offset
+        elif offset + length > size:
+            raise ValueError(f"Range {offset}+{length} is past the end of {path}")
+        if length == 0:
+            # Empty files cannot be mapped.
+            return memoryview(b"")
+        mapped = mmap.mmap(
+            f.fileno(),
+            length + offset - aligned,
+            offset=aligned,
+            access=mmap.ACCESS_READ,
+        )
+    return memoryview(mapped)[offset - aligned :]
+
+
+def parse_from_file(
+    path: str, message_cls: Type[M], offset: int = 0, length: int = 0
+) -> M:
+    """Parses the single message stored in `length` bytes of `path` from `offset`."""
+    return message_cls.FromString(map_file(path, offset, length))
+
+
+def decode_many(raws: Iterable[Buffer], message_cls: Type[M]) -> List[M]:
+    """Decodes every serialized message in `raws` into a `message_cls` instance.
+
+    The loop runs in C through `map`, so with the upb backend no Python bytecode is
+    executed per message.
+    """
+    return list(map(message_cls.FromString, raws))
+
+
+def decode_length_prefixed(buf: Buffer, message_cls: Type[M]) -> List[M]:
+    """Decodes every length prefixed message in `buf` into a `message_cls` instance."""
+    return decode_many(iter_length_prefixed_frames(buf), message_cls)
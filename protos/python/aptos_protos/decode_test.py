@@ -0,0 +1,155 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+import array
+import mmap
+import os
+import tempfile
+import unittest
+from typing import List
+
+from aptos_protos._wire import DecodeError
+from aptos_protos.aptos.transaction.v1.transaction_pb2 import (
+    Transaction,
+    WriteSetChange,
+)
+from aptos_protos.decode import (
+    decode_length_prefixed,
+    decode_many,
+    encode_length_prefixed,
+    iter_length_prefixed_frames,
+    map_file,
+    parse_from_file,
+)
+
+
+def make_transactions(count: int) -> List[Transaction]:
+    transactions = []
+    for i in range(count):
+        transaction = Transaction(
+            version=i, type=Transaction.TRANSACTION_TYPE_USER, block_height=i // 2
+        )
+        transaction.info.hash = bytes([i]) * 32
+        transaction.info.gas_used = 100 * i
+        # Enough changes for some messages to need a multi-byte length prefix.
+        for j in range(i * 10):
+            change = transaction.info.changes.add()
+            change.type = WriteSetChange.TYPE_WRITE_RESOURCE
+            change.write_resource.address = "0x1"
+            change.write_resource.type_str = f"0x1::coin::CoinStore<{j}>"
+        transactions.append(transaction)
+    return transactions
+
+
+class LengthPrefixedTestCase(unittest.TestCase):
+    def testRoundTrip(self) -> None:
+        transactions = make_transactions(5)
+        buf = encode_length_prefixed(transactions)
+        self.assertEqual(decode_length_prefixed(buf, Transaction), transactions)
+        self.assertEqual(
+            decode_length_prefixed(memoryview(buf), Transaction), transactions
+        )
+        self.assertEqual(
+            decode_length_prefixed(bytearray(buf), Transaction), transactions
+        )
+
+    def testTypedBuffer(self) -> None:
+        transactions = make_transactions(3)
+        buf = encode_length_prefixed(transactions)
+        # Pad to a multiple of 8 bytes with empty messages.
+        buf += bytes(-len(buf) % 8)
+        decoded = decode_length_prefixed(array.array("Q", buf), Transaction)
+        self.assertEqual(decoded[:3], transactions)
+        self.assertEqual(decoded[3:], [Transaction()] * (len(decoded) - 3))
+        view = memoryview(buf).cast("B", (len(buf) // 8, 8))
+        self.assertEqual(decode_length_prefixed(view, Transaction), decoded)
+
+    def testFrames(self) -> None:
+        transactions = make_transactions(3)
+        frames = list(iter_length_prefixed_frames(encode_length_prefixed(transactions)))
+        self.assertEqual(
+            [bytes(frame) for frame in frames],
+            [transaction.SerializeToString() for transaction in transactions],
+        )
+
+    def testEmpty(self) -> None:
+        self.assertEqual(encode_length_prefixed([]), b"")
+        self.assertEqual(decode_length_prefixed(b"", Transaction), [])
+        # Empty messages are a zero length prefix with no payload.
+        self.assertEqual(
+            decode_length_prefixed(b"\x00\x00", Transaction),
+            [Transaction(), Transaction()],
+        )
+
+    def testTruncated(self) -> None:
+        buf = encode_length_prefixed(make_transactions(3))
+        with self.assertRaises(DecodeError):
+            decode_length_prefixed(buf[:-1], Transaction)
+        with self.assertRaises(DecodeError):
+            decode_length_prefixed(b"\x80", Transaction)
+
+    def testDecodeMany(self) -> None:
+        transactions = make_transactions(4)
+        raws = [transaction.SerializeToString() for transaction in transactions]
+        self.assertEqual(decode_many(raws, Transaction), transactions)
+        self.assertEqual(decode_many(map(memoryview, raws), Transaction), transactions)
+        self.assertEqual(decode_many([], Transaction), [])
+
+
+class MapFileTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        f = tempfile.NamedTemporaryFile(delete=False)
+        self.addCleanup(os.unlink, f.name)
+        self.path = f.name
+        # Put a message behind a prefix that is not a multiple of the allocation
+        # granularity, so mapping it needs an aligned offset.
+        self.prefix = b"\xaa" * (mmap.ALLOCATIONGRANULARITY + 3)
+        self.transactions = make_transactions(3)
+        self.raw = self.transactions[2].SerializeToString()
+        with f:
+            f.write(self.prefix + self.raw)
+
+    def testWholeFile(self) -> None:
+        self.assertEqual(bytes(map_file(self.path)), self.prefix + self.raw)
+
+    def testOffset(self) -> None:
+        offset = len(self.prefix)
+        self.assertEqual(bytes(map_file(self.path, offset)), self.raw)
+        self.assertEqual(bytes(map_file(self.path, offset - 5, 5)), b"\xaa" * 5)
+        self.assertEqual(
+            parse_from_file(self.path, Transaction, offset), self.transactions[2]
+        )
+        self.assertEqual(
+            parse_from_file(self.path, Transaction, offset, len(self.raw)),
+            self.transactions[2],
+        )
+
+    def testLengthPrefixed(self) -> None:
+        with open(self.path, "wb") as f:
+            f.write(encode_length_prefixed(self.transactions))
+        self.assertEqual(
+            decode_length_prefixed(map_file(self.path), Transaction),
+            self.transactions,
+        )
+
+    def testEndOfFile(self) -> None:
+        size = len(self.prefix) + len(self.raw)
+        self.assertEqual(bytes(map_file(self.path, size)), b"")
+        with self.assertRaises(ValueError):
+            map_file(self.path, size + 1)
+        with self.assertRaises(ValueError):
+            map_file(self.path, size - 1, 2)
+        with self.assertRaises(ValueError):
+            map_file(self.path, -1)
+        with self.assertRaises(ValueError):
+            map_file(self.path, 0, -1)
+
+    def testEmptyFile(self) -> None:
+        with open(self.path, "wb"):
+            pass
+        self.assertEqual(bytes(map_file(self.path)), b"")
+        self.assertEqual(parse_from_file(self.path, Transaction), Transaction())
+
+
+if __name__ == "__main__":
+    unittest.main()
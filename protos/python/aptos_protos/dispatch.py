@@ -0,0 +1,75 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Table based dispatch on the enum `type` fields of messages.
+
+Instead of an `if`/`elif` chain over `Transaction.TransactionType` or
+`WriteSetChange.Type`, build an `EnumDispatcher` once and call it per message. The
+handlers are kept in a tuple indexed by the enum value, so dispatching is a single
+lookup no matter how many types there are:
+
+```python
+handle = EnumDispatcher(
+    Transaction.TransactionType,
+    {
+        Transaction.TRANSACTION_TYPE_USER: handle_user,
+        Transaction.TRANSACTION_TYPE_BLOCK_METADATA: handle_block_metadata,
+    },
+    default=skip,
+)
+for transaction in transactions:
+    handle(transaction)
+```
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Mapping, Optional, Tuple, TypeVar
+
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+
+T = TypeVar("T")
+
+Handler = Callable[[Any], T]
+
+
+class EnumDispatcher(Generic[T]):
+    """Calls the handler registered for the value of an enum field of a message.
+
+    `default` handles enum values without a registered handler, including values
+    unknown to this version of the protos. Without a default such values raise a
+    `ValueError`.
+    """
+
+    def __init__(
+        self,
+        enum_type: _enum_type_wrapper.EnumTypeWrapper,
+        handlers: Mapping[int, Handler[T]],
+        default: Optional[Handler[T]] = None,
+        field: str = "type",
+    ):
+        values = enum_type.values()
+        if min(values) < 0:
+            raise ValueError(f"{enum_type.DESCRIPTOR.name} has negative values")
+        table = [default] * (max(values) + 1)
+        for value, handler in handlers.items():
+            if value not in values:
+                raise ValueError(f"{value} is not a {enum_type.DESCRIPTOR.name} value")
+            table[value] = handler
+        self._enum_type = enum_type
+        self._table: Tuple[Optional[Handler[T]], ...] = tuple(table)
+        self._default = default
+        self._field = field
+
+    def __call__(self, message: Any) -> T:
+        value = getattr(message, self._field)
+        # Unknown values can be negative as well, which must not index from the end.
+        if 0 <= value < len(self._table):
+            handler = self._table[value]
+        else:
+            handler = self._default
+        if handler is None:
+            raise ValueError(
+                f"No handler for {self._enum_type.DESCRIPTOR.name} value {value}"
+            )
+        return handler(message)
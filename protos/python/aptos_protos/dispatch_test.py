@@ -0,0 +1,59 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from aptos_protos.aptos.transaction.v1.transaction_pb2 import Transaction
+from aptos_protos.dispatch import EnumDispatcher
+
+# Transaction with its `type` field (6) set to -1, which is encoded as a ten byte
+# varint.
+NEGATIVE_TYPE = b"\x30" + b"\xff" * 9 + b"\x01"
+
+
+class EnumDispatcherTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dispatch = EnumDispatcher(
+            Transaction.TransactionType,
+            {
+                Transaction.TRANSACTION_TYPE_USER: lambda _: "user",
+                Transaction.TRANSACTION_TYPE_VALIDATOR: lambda _: "validator",
+            },
+            default=lambda _: "default",
+        )
+
+    def testDispatch(self) -> None:
+        user = Transaction(type=Transaction.TRANSACTION_TYPE_USER)
+        validator = Transaction(type=Transaction.TRANSACTION_TYPE_VALIDATOR)
+        self.assertEqual(self.dispatch(user), "user")
+        self.assertEqual(self.dispatch(validator), "validator")
+
+    def testDefault(self) -> None:
+        genesis = Transaction(type=Transaction.TRANSACTION_TYPE_GENESIS)
+        self.assertEqual(self.dispatch(genesis), "default")
+
+    def testUnknownValues(self) -> None:
+        unknown = Transaction.FromString(b"\x30\x15")
+        self.assertEqual(unknown.type, 21)
+        self.assertEqual(self.dispatch(unknown), "default")
+        negative = Transaction.FromString(NEGATIVE_TYPE)
+        self.assertEqual(negative.type, -1)
+        self.assertEqual(self.dispatch(negative), "default")
+
+    def testNoDefault(self) -> None:
+        dispatch = EnumDispatcher(
+            Transaction.TransactionType,
+            {Transaction.TRANSACTION_TYPE_USER: lambda _: "user"},
+        )
+        with self.assertRaises(ValueError):
+            dispatch(Transaction(type=Transaction.TRANSACTION_TYPE_GENESIS))
+        with self.assertRaises(ValueError):
+            dispatch(Transaction.FromString(NEGATIVE_TYPE))
+
+    def testInvalidHandlers(self) -> None:
+        with self.assertRaises(ValueError):
+            EnumDispatcher(Transaction.TransactionType, {5: lambda _: None})
+
+
+if __name__ == "__main__":
+    unittest.main()
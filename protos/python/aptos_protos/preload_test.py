@@ -0,0 +1,39 @@
+# Copyright © Aptos Foundation
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Run in a fresh interpreter, generated modules imported by other tests would
+# otherwise already be loaded.
+SCRIPT = """
+import sys
+import aptos_protos
+
+aptos_protos.preload()
+loaded = set(sys.modules)
+import aptos.indexer.v1.raw_data_pb2_grpc
+import aptos.transaction.v1.transaction_pb2
+import aptos_protos.aptos.indexer.v1.raw_data_pb2_grpc
+import aptos_protos.aptos.transaction.v1.transaction_pb2
+print(sorted(set(sys.modules) - loaded))
+"""
+
+
+class PreloadTestCase(unittest.TestCase):
+    def testPreload(self) -> None:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,17 +13,11 @@ echo
 export PYTHONWARNINGS="ignore"
 
 PROTO_DIR=../proto
-WORKING_DIR=`mktemp -d`
 OUT_DIR=./aptos_protos
 
-# Save __init__.py
-mv $OUT_DIR/__init__.py $WORKING_DIR/__init__.py
-
-# Delete the old generated files.
-rm -rf $OUT_DIR
-
-# Create the output directory.
-mkdir -p $OUT_DIR
+# Delete the old generated files. Everything directly inside $OUT_DIR (__init__.py,
+# the decoding helpers, etc.) is written by hand and is kept as is.
+rm -rf $OUT_DIR/aptos
 
 # Generate the protos to a temporary directory.
 python -m grpc_tools.protoc \
@@ -37,9 +31,6 @@ python -m grpc_tools.protoc \
     $PROTO_DIR/aptos/transaction/v1/transaction.proto \
     $PROTO_DIR/aptos/util/timestamp/timestamp.proto
 
-# Restore __init__.py
-mv $WORKING_DIR/__init__.py $OUT_DIR/__init__.py
-
 # Format code.
 isort $OUT_DIR
 black $OUT_DIR
@@ -6,20 +6,35 @@ import subprocess, re
 BLOCK_SIZES = ["1k", "10k", "50k"]
 THRESHOLDS = {"1k": 3500, "10k": 4000, "50k": 4200}
 THRESHOLD_NOISE = 0.1
+AVG_TPS_PATTERN = re.compile(r"Avg Sequential TPS = (\d+)")
 
-# Run the VM sequential execution with performance optimizations enabled
+# Run the VM sequential execution with performance optimizations enabled, streaming
+# its output and collecting the results as they are printed
 target_directory = "aptos-move/aptos-transaction-benchmarks/src/"
-output = subprocess.check_output(
-    "cargo run --profile performance  param-sweep  --skip-parallel",
+command = "cargo run --profile performance  param-sweep  --skip-parallel"
+avg_tps = []
+with subprocess.Popen(
+    command,
     shell=True,
     text=True,
+    bufsize=1,
+    stdout=subprocess.PIPE,
     cwd=target_directory,
-)
-print(output)
+) as process:
+    for line in process.stdout:
+        print(line, end="")
+        match = AVG_TPS_PATTERN.search(line)
+        if match:
+            avg_tps.append(int(match.group(1)))
+if process.returncode != 0:
+    raise subprocess.CalledProcessError(process.returncode, command)
+
+if len(avg_tps) < len(BLOCK_SIZES):
+    print(f"Expected {len(BLOCK_SIZES)} sequential TPS results, found {len(avg_tps)}")
+    exit(1)
 
 fail = False
-for i, block_size in enumerate(BLOCK_SIZES):
-    tps = int(re.findall(r"Avg Sequential TPS = (\d+)", output)[i])
+for block_size, tps in zip(BLOCK_SIZES, avg_tps):
     print(
         f"Average Sequential TPS for {block_size} block: {tps}, Threshold TPS: {THRESHOLDS[block_size]}"
     )